@@ -23,7 +23,6 @@ sys.path.append(str(Path(__file__).resolve().parent / "src"))
 
 from red_list_index.data_frame_processor import DataFrameProcessor
 from red_list_index.calculate_groups import CalculateGroups
-from red_list_index.plot import Plot
 from red_list_index.group_year_interpolation import GroupYearInterpolation
 from red_list_index.group_year_extrapolation import GroupYearExtrapolation
 from red_list_index.group_year_aggregate import GroupYearAggregate
@@ -36,6 +35,25 @@ def get_project_version() -> str:
     return data["project"]["version"]
 
 
+class VersionAction(argparse.Action):
+    """
+    Print the project version and exit, reading pyproject.toml only when --version is used.
+    """
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, help=None):
+        super().__init__(
+            option_strings=option_strings,
+            dest=dest,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help=help,
+        )
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        print(f"{parser.prog} {get_project_version()}")
+        parser.exit()
+
+
 def limit_number_of_repetitions(value: str) -> int:
     ivalue = int(value)
     if ivalue > 10000 or ivalue < 1:
@@ -58,6 +76,12 @@ def main() -> int:
         default=1000,
         help="Number of repetitions (default: 1000, minimum: 1, maximum: 10000)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the random sampling of Data Deficient species (default: unseeded)",
+    )
     parser.add_argument(
         "--plot", action="store_true", default=False, help="Save output plot as PNG"
     )
@@ -66,8 +90,7 @@ def main() -> int:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {get_project_version()}",
+        action=VersionAction,
         help="Show version number and exit",
     )
     parser.add_argument(
@@ -88,34 +111,51 @@ def main() -> int:
 
     input_file = args.input_csv
     output_file = args.output_csv
+    output_dir = Path(output_file).parent
     number_of_repetitions = args.number_of_repetitions
 
     try:
         df = DataFrameProcessor(input_file).df
         logging.info(f"Processing and validating dataframe for: {input_file}")
-        rli_df = CalculateGroups(df, number_of_repetitions).df
+        rli_df = CalculateGroups(df, number_of_repetitions, seed=args.seed).df
         logging.info(
             f"Building Global Red List Index DataFrame (repetitions: {number_of_repetitions})"
         )
         rli_df = GroupYearInterpolation.interpolate_rli_for_missing_years(rli_df)
         logging.info("Interpolating RLI for missing years")
-        rli_df_extrapolated = GroupYearExtrapolation.extrapolate_trends_for(rli_df)
+        # The extrapolation, aggregation, concat and CSV write are built as one
+        # lazy query plan so Polars can fuse them and stream the result to disk.
+        rli_lf_extrapolated = GroupYearExtrapolation.extrapolate_trends_for(
+            rli_df.lazy()
+        )
         logging.info("Extrapolating RLI to extend years")
-        rli_df_aggregated = GroupYearAggregate.calculate_aggregate_from(
-            rli_df_extrapolated
+        rli_lf_aggregated = GroupYearAggregate.calculate_aggregate_from(
+            rli_lf_extrapolated
         )
-        rli_df = pl.concat([rli_df, rli_df_aggregated], how="vertical")
-        logging.info("Aggregated RLI")
-        rli_df = rli_df.with_columns(
-            pl.col("taxonomic_group_sample_sizes").cast(pl.Utf8)
+        # Both frames share the same schema, so a plain vertical concat without a
+        # rechunk keeps their existing buffers in place instead of copying them.
+        rli_lf = pl.concat(
+            [rli_df.lazy(), rli_lf_aggregated], how="vertical", rechunk=False
         )
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        rli_df.write_csv(output_file)
-        logging.info(f"Saved results to: {output_file}")
+        logging.info("Aggregated RLI")
+        # The CSV and the optional plot are both written here, so create it once,
+        # and only after the results have been computed.
+        output_dir.mkdir(parents=True, exist_ok=True)
         if args.plot:
+            # Imported here so runs without --plot skip loading matplotlib/seaborn.
+            from red_list_index.plot import Plot
+
+            # Run the plan once so the CSV and the plot come from the same frame.
+            rli_df = rli_lf.collect()
+            rli_df.write_csv(output_file)
+            logging.info(f"Saved results to: {output_file}")
             plot = Plot(rli_df)
             plot.global_rli(output_file.replace(".csv", ".png"))
             logging.info(f"Saved plot to: {output_file.replace('.csv', '.png')}")
+        else:
+            # Larger batches mean fewer write calls per run than the default of 1024 rows.
+            rli_lf.sink_csv(output_file, batch_size=65536)
+            logging.info(f"Saved results to: {output_file}")
         if args.duration:
             if start_time is not None:
                 elapsed = time.time() - start_time
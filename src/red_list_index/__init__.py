@@ -1,9 +1,15 @@
-from .calculate import Calculate
-from .data_frame_processor import DataFrameProcessor
-from .plot import Plot
-from .group_year_interpolation import GroupYearInterpolation
-from .group_year_extrapolation import GroupYearExtrapolation
-from .group_year_aggregate import GroupYearAggregate
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing the
+# package does not pull in matplotlib/seaborn unless Plot is actually used.
+_LAZY_IMPORTS = {
+    "Calculate": ".calculate",
+    "DataFrameProcessor": ".data_frame_processor",
+    "Plot": ".plot",
+    "GroupYearInterpolation": ".group_year_interpolation",
+    "GroupYearExtrapolation": ".group_year_extrapolation",
+    "GroupYearAggregate": ".group_year_aggregate",
+}
 
 __all__ = [
     "Calculate",
@@ -13,3 +19,15 @@ __all__ = [
     "GroupYearExtrapolation",
     "GroupYearAggregate",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
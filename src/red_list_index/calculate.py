@@ -1,6 +1,63 @@
 from dataclasses import dataclass
-from typing import List
-from .constants import RED_LIST_CATEGORY_WEIGHTS
+from typing import List, Union
+
+import numpy as np
+
+from .constants import WEIGHT_OF_EXTINCT
+
+
+def red_list_index_from_counts(
+    weight_counts: np.ndarray, weight_of_extinct: int
+) -> np.ndarray:
+    """
+    Return the Red List Index from the number of species at each category weight.
+
+    weight_counts[..., w] is the number of species with weight w (0 to EX). A 2D array of
+    shape (repetitions, EX + 1) gives one Red List Index per repetition.
+    """
+    if weight_counts.shape[-1] != weight_of_extinct + 1:
+        raise ValueError(
+            f"Expected {weight_of_extinct + 1} weight counts (0 to EX), got {weight_counts.shape[-1]}."
+        )
+    weights = np.arange(weight_of_extinct + 1)
+    return 1.0 - (weight_counts @ weights) / (
+        weight_of_extinct * weight_counts.sum(axis=-1)
+    )
+
+
+def validate_category_weights(category_weights) -> np.ndarray:
+    """
+    Return category_weights as an integer array, raising ValueError unless every weight
+    is an integer from 0 to EX.
+    """
+    weights = np.asarray(category_weights)
+    if weights.size == 0:
+        raise ValueError("category_weights cannot be empty.")
+    if weights.dtype.kind not in "iu":
+        # Nulls and non-integers make NumPy fall back to an object/float/str array;
+        # walk the values only in that case to report the first offending index.
+        for index, weight in enumerate(category_weights):
+            if weight is None:
+                raise ValueError(
+                    f"Null value found at index {index} in category_weights."
+                )
+            if not isinstance(weight, (int, np.integer)):
+                raise ValueError(
+                    f"Non-integer value found at index {index}: {weight} ({type(weight).__name__})"
+                )
+        weights = weights.astype(np.int64)
+
+    # Two reductions decide the valid case; the offending index is only looked up
+    # when one of them fails.
+    if weights.min() < 0:
+        index = np.argmax(weights < 0)
+        raise ValueError(f"Negative value found at index {index}: {weights[index]}")
+    if weights.max() > WEIGHT_OF_EXTINCT:
+        index = np.argmax(weights > WEIGHT_OF_EXTINCT)
+        raise ValueError(
+            f"Value greater than EX found at index {index}: {weights[index]} > {WEIGHT_OF_EXTINCT}"
+        )
+    return weights
 
 
 @dataclass
@@ -9,7 +66,7 @@ class Calculate:
     Calculator for the Red List Index.
 
     Args:
-        category_weights (list of numbers): List of weights for categories, e.g. [1, 2, 3, 4, 5].
+        category_weights (list of numbers or numpy.ndarray): Weights for categories, e.g. [1, 2, 3, 4, 5].
 
     Example:
         >>> calculate = Calculate([1, 2, 3, 4, 5])
@@ -17,35 +74,18 @@ class Calculate:
         0.4
     """
 
-    category_weights: List[int]
+    category_weights: Union[List[int], np.ndarray]
 
     def red_list_index(self):
-        sum_of_weights = sum(self.category_weights)
-        calculated_red_list_index = 1 - (
-            sum_of_weights
-            / (RED_LIST_CATEGORY_WEIGHTS["EX"] * len(self.category_weights))
-        )
-        return calculated_red_list_index
+        return float(red_list_index_from_counts(self._weight_counts, WEIGHT_OF_EXTINCT))
 
     def __post_init__(self):
         # __post_init__ is called automatically after the dataclass __init__ method.
         # Here, we perform some validation on category_weights to ensure correctness before calculations.
 
-        if not self.category_weights:
-            raise ValueError("category_weights cannot be empty.")
-        for index, weight in enumerate(self.category_weights):
-            if weight is None:
-                raise ValueError(
-                    f"Null value found at index {index} in category_weights."
-                )
-            if not isinstance(weight, int):
-                raise ValueError(
-                    f"Non-integer value found at index {index}: {weight} ({type(weight).__name__})"
-                )
-            if weight < 0:
-                raise ValueError(f"Negative value found at index {index}: {weight}")
-            if weight > RED_LIST_CATEGORY_WEIGHTS["EX"]:
-                raise ValueError(
-                    f"Value greater than EX found at index {index}: {weight} > {RED_LIST_CATEGORY_WEIGHTS['EX']}"
-                )
+        weights = validate_category_weights(self.category_weights)
+
+        # Only the number of species at each weight matters, so keep a histogram of
+        # EX + 1 counts rather than the full list of weights.
+        self._weight_counts = np.bincount(weights, minlength=WEIGHT_OF_EXTINCT + 1)
         return True
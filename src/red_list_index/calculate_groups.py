@@ -1,7 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import polars as pl
 import numpy as np
 
-from red_list_index.calculate import Calculate
+from red_list_index.calculate import (
+    red_list_index_from_counts,
+    validate_category_weights,
+)
+from red_list_index.constants import WEIGHT_OF_EXTINCT
+
+# Columns of CalculateGroups.df, in the order of the per-cell result tuples.
+_RESULT_COLUMNS = (
+    "taxonomic_group",
+    "year",
+    "rli",
+    "qn_95",
+    "qn_05",
+    "n",
+    "taxonomic_group_sample_sizes",
+)
 
 
 class CalculateGroups:
@@ -14,118 +31,159 @@ class CalculateGroups:
       number_of_repetitions (int): The number of repetitions for RLI simulations to account for variability.
 
     Methods:
-      __init__(df, number_of_repetitions=1):
+      __init__(df, number_of_repetitions=1, seed=None):
         Initializes the CalculateGroups instance, processes the input DataFrame, and prepares it for RLI calculations.
+        All random sampling is drawn from a single NumPy Generator seeded with `seed`, so passing the same seed
+        reproduces the same results.
 
       _build_global_red_list_indices(df):
-        Builds a DataFrame containing Red List Index (RLI) results for each group and year. For each unique group in the
-        input DataFrame, this function iterates over all years associated with that group.
+        Builds a DataFrame containing Red List Index (RLI) results for each group and year. The rows are partitioned
+        into group/year cells in a single pass, instead of filtering the full DataFrame for every group/year
+        combination. Cells are independent of each other, so they are processed concurrently in a thread pool
+        (each with its own random generator spawned from the instance generator).
 
-        It computes the RLI for each group and year combination by calling `calculate_rli_for`, repeating the calculation
+        It computes the RLI for each group and year combination by calling `_calculate_rli_for`, repeating the calculation
         a specified number of times to account for uncertainty or variability due to any included Data Deficient (DD) species.
         The results for all combinations are collected and returned as a new Polars DataFrame.
 
-      _calculate_rli_for(row_df, number_of_repetitions=1):
-        Calculates the RLI and summary statistics for a given group/year subset of data. Performs repeated simulations
-        to estimate the RLI, replacing Data Deficient rows and computing the mean, percentiles, and sample sizes.
+      _calculate_rli_for(row_df, number_of_repetitions=1, rng=None):
+        Calculates the RLI and summary statistics for a given group/year subset of data, using `rng` (or the instance
+        generator) for the random sampling.
+
+        It returns a tuple of the mean RLI, the 95th and 5th percentiles, the number of repetitions, and the sample size
+        of the group as a "Group (n)" string.
 
-        It returns the mean RLI, the 95th and 5th percentiles, the number of repetitions, and a dictionary
-        of sample sizes for each group in the data.
+      _generate_rli_collection(row_df, number_of_repetitions, rng=None):
+        Returns an array with one RLI per repetition. The valid weights are counted per weight once, the sampled
+        weight counts of the Data Deficient species are added to them for each repetition, and every repetition's
+        RLI is computed from the resulting counts. Without Data Deficient species all repetitions share one RLI.
 
-      _replace_data_deficient_rows(df):
-        Replaces Data Deficient (DD) weights in the DataFrame with randomly sampled valid weights.
-        As per Butchart et al. (2010), Red List categories (from Least Concern to Extinct) are assigned to all
-        Data Deficient species, with a probability proportional to the number of species in non-Data Deficient
-        categories for that taxonomic group.
+      _sample_random_weight_counts(valid_weight_counts, count, number_of_repetitions=1, rng=None):
+        Returns, for each repetition, how many of `count` Data Deficient (DD) species are assigned each weight
+        when weights are sampled with replacement from the valid weights, drawn as multinomial counts. As per
+        Butchart et al. (2010), Red List categories (from Least Concern to Extinct) are assigned to all Data Deficient
+        species, with a probability proportional to the number of species in non-Data Deficient categories for that
+        taxonomic group.
     """
 
-    def __init__(self, df, number_of_repetitions=1):
+    def __init__(self, df, number_of_repetitions=1, seed=None):
         self.number_of_repetitions = number_of_repetitions
+        self._rng = np.random.default_rng(seed)
         self.df = self._build_global_red_list_indices(df)
 
     def _build_global_red_list_indices(self, df):
-        rli_df = []
-        for group in df["taxonomic_group"].unique():
-            years = df.filter(pl.col("taxonomic_group") == group)["year"].unique()
-            for year in years:
-                result = self._build_group_year_rli(df, group, year)
-                rli_df.append(result)
-        return pl.DataFrame(rli_df)
-
-    def _build_group_year_rli(self, df, group, year):
-        group_rows_by_year = df.filter(
-            (pl.col("year") == year) & (pl.col("taxonomic_group") == group)
+        # Only these columns are used per cell, so the partitions below copy nothing else.
+        df = df.select("taxonomic_group", "year", "weights")
+        # Split the rows into (group, year) cells in one pass rather than filtering the
+        # whole frame per cell. Partition order does not matter because the cells are
+        # sorted, so a seeded run draws the same samples for each cell.
+        cells = df.partition_by(
+            ["taxonomic_group", "year"], as_dict=True, maintain_order=False
         )
+        cell_keys = sorted(cells)
+        # One child generator per cell keeps each cell's random stream independent
+        # of how the thread pool schedules the work.
+        cell_rngs = self._rng.spawn(len(cell_keys))
+        with ThreadPoolExecutor() as executor:
+            rli_rows = list(
+                executor.map(
+                    lambda key, rng: self._build_group_year_rli(cells[key], *key, rng),
+                    cell_keys,
+                    cell_rngs,
+                )
+            )
+        # Transpose the row tuples into one sequence per column instead of inferring
+        # the schema from every row. Without any cells the columns are empty.
+        columns = list(zip(*rli_rows)) or [()] * len(_RESULT_COLUMNS)
+        return pl.DataFrame(dict(zip(_RESULT_COLUMNS, columns)))
+
+    def _build_group_year_rli(self, group_rows_by_year, group, year, rng=None):
         group_year_results = self._calculate_rli_for(
-            group_rows_by_year, self.number_of_repetitions
+            group_rows_by_year, self.number_of_repetitions, rng
         )
-        return {**{"taxonomic_group": group, "year": year}, **group_year_results}
+        return (group, year, *group_year_results)
 
-    def _calculate_rli_for(self, row_df, number_of_repetitions=1):
+    def _calculate_rli_for(self, row_df, number_of_repetitions=1, rng=None):
         """Calculate the Red List Index (RLI) and related statistics for the given DataFrame."""
-        rli_collection = self._generate_rli_collection(row_df, number_of_repetitions)
+        rli_collection = self._generate_rli_collection(
+            row_df, number_of_repetitions, rng
+        )
         return self._summarize_rli_collection(
             rli_collection, number_of_repetitions, row_df
         )
 
-    def _generate_rli_collection(self, row_df, number_of_repetitions):
-        """Generate a list of RLI values by bootstrapping."""
-        return [self._single_rli(row_df) for _ in range(number_of_repetitions)]
+    def _generate_rli_collection(self, row_df, number_of_repetitions, rng=None):
+        """Generate an array of RLI values by bootstrapping, one per repetition."""
+        valid_weights = self._get_valid_weights(row_df)
+        data_deficient_count = self._get_data_deficient_count(row_df)
+
+        valid_weight_counts = np.bincount(
+            valid_weights, minlength=WEIGHT_OF_EXTINCT + 1
+        )
+        if data_deficient_count == 0:
+            # Without Data Deficient species every repetition gives the same RLI.
+            return np.full(
+                number_of_repetitions,
+                red_list_index_from_counts(valid_weight_counts, WEIGHT_OF_EXTINCT),
+            )
+        random_weight_counts = self._sample_random_weight_counts(
+            valid_weight_counts, data_deficient_count, number_of_repetitions, rng
+        )
+        return red_list_index_from_counts(
+            valid_weight_counts + random_weight_counts, WEIGHT_OF_EXTINCT
+        )
 
     def _summarize_rli_collection(self, rli_collection, number_of_repetitions, row_df):
         """Summarize the RLI collection with statistics and metadata."""
         # The RLI (Red List Index) summary statistics are calculated as follows:
         # - The mean RLI is computed using numpy's np.mean, which calculates the arithmetic mean as specified in Butchart et al., 2010.
-        # - The 95th and 5th percentiles (qn_95 and qn_05) are computed using np.percentile to provide uncertainty intervals.
+        # - The 95th and 5th percentiles (qn_95 and qn_05) are computed with a single np.percentile call, which
+        #   partitions the collection once for both, to provide uncertainty intervals.
         # - The total number of bootstrap repetitions (n) is recorded.
         # - The sample sizes for each taxonomic group are included for reference.
-
-        return {
-            "rli": np.mean(rli_collection),
-            "qn_95": np.percentile(rli_collection, 95),
-            "qn_05": np.percentile(rli_collection, 5),
-            "n": number_of_repetitions,
-            "taxonomic_group_sample_sizes": self._taxonomic_group_sample_sizes_for(
-                row_df
-            ),
-        }
-
-    def _single_rli(self, row_df):
-        """Calculate a single RLI value for the given DataFrame, replacing data deficient rows as needed."""
-        weights_for_group_and_year = self._replace_data_deficient_rows(row_df)
-
-        return Calculate(weights_for_group_and_year).red_list_index()
+        qn_05, qn_95 = np.percentile(rli_collection, [5, 95])
+
+        # Returned in the order of the rli, qn_95, qn_05, n and
+        # taxonomic_group_sample_sizes entries of _RESULT_COLUMNS.
+        return (
+            np.mean(rli_collection),
+            qn_95,
+            qn_05,
+            number_of_repetitions,
+            self._taxonomic_group_sample_sizes_for(row_df),
+        )
 
     def _taxonomic_group_sample_sizes_for(self, row_df):
-        """Get the count of occurrences for each taxonomic_group in the input DataFrame."""
-        counts_df = row_df.select(pl.col("taxonomic_group").value_counts())
-
-        taxonomic_group_counts = counts_df["taxonomic_group"].to_list()
-        return f"{taxonomic_group_counts[0]['taxonomic_group']} ({taxonomic_group_counts[0]['count']})"
-
-    def _replace_data_deficient_rows(self, df):
-        """Replace null weights in DataFrame with random samples from valid weights."""
-        valid_weights = self._get_valid_weights(df)
-        data_deficient_count = self._get_data_deficient_count(df)
-
-        random_weights = self._sample_random_weights(
-            valid_weights, data_deficient_count
-        )
-        return valid_weights.tolist() + random_weights.tolist()
+        """Get the taxonomic_group and its number of rows in the input DataFrame."""
+        # Each group/year partition holds a single taxonomic group, so its row count
+        # is the group's sample size and no value_counts aggregation is needed.
+        return f"{row_df.item(0, 'taxonomic_group')} ({row_df.height})"
 
     def _get_valid_weights(self, df):
-        """Return all valid (non-null) weights as a numpy array."""
-        valid_weights = df.filter(pl.col("weights").is_not_null())["weights"].to_numpy()
+        """Return all valid (non-null) weights as an int8 numpy array."""
+        valid_weights = df["weights"].drop_nulls().to_numpy()
         if valid_weights.size == 0:
             raise ValueError("No valid weights found in the DataFrame to sample from.")
-        return valid_weights
+        # Check the weights before the int8 cast, which would wrap values above 127
+        # and truncate non-integers instead of rejecting them.
+        return validate_category_weights(valid_weights).astype(np.int8, copy=False)
 
     def _get_data_deficient_count(self, df):
         """Return the number of rows with null weights."""
-        return df.filter(pl.col("weights").is_null()).height
-
-    def _sample_random_weights(self, valid_weights, count):
-        """Randomly sample 'count' weights from valid_weights (without replacement)."""
-        if count == 0:
-            return np.array([])
-        return np.random.choice(valid_weights, size=count, replace=False)
+        # Polars tracks the null count of each column, so this does not scan the rows.
+        return df["weights"].null_count()
+
+    def _sample_random_weight_counts(
+        self, valid_weight_counts, count, number_of_repetitions=1, rng=None
+    ):
+        """Return a (repetitions, EX + 1) array counting the weights of 'count' samples drawn from the valid weights (with replacement)."""
+        rng = self._rng if rng is None else rng
+        # Each Data Deficient species is independently assigned a weight with probability
+        # proportional to the number of valid species carrying it, so the per-weight counts
+        # of one repetition follow a multinomial distribution. Drawing those counts directly
+        # costs O(categories) rather than O(species) per repetition.
+        return rng.multinomial(
+            count,
+            valid_weight_counts / valid_weight_counts.sum(),
+            size=number_of_repetitions,
+        )
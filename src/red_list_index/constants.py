@@ -12,3 +12,6 @@ RED_LIST_CATEGORY_WEIGHTS = {
     "EX": 5,  # Extinct
     "DD": None,  # Data Deficient
 }
+
+# Weight of the Extinct category, the maximum weight
+WEIGHT_OF_EXTINCT = RED_LIST_CATEGORY_WEIGHTS["EX"]
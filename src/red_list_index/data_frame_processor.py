@@ -1,6 +1,16 @@
 import polars as pl
 from .constants import RED_LIST_CATEGORY_WEIGHTS
 
+# Red List categories as a fixed Enum, so each category string is encoded once as
+# its integer position in RED_LIST_CATEGORY_WEIGHTS.
+_RED_LIST_CATEGORY_ENUM = pl.Enum(list(RED_LIST_CATEGORY_WEIGHTS))
+
+# Category weights indexed by that position (DD maps to null). Weights never exceed
+# EX, so Int8 is wide enough.
+_CATEGORY_WEIGHT_LOOKUP = pl.Series(
+    "weights", list(RED_LIST_CATEGORY_WEIGHTS.values()), dtype=pl.Int8
+)
+
 
 class DataFrameProcessor:
     """
@@ -15,26 +25,24 @@ class DataFrameProcessor:
 
     Methods:
         __init__(input_file):
-            Initializes the DataFrameProcessor instance by loading the input CSV file into
-            a DataFrame and performing validation and processing steps.
+            Initializes the DataFrameProcessor instance by lazily scanning the input CSV file,
+            loading only the columns defined in INPUT_DATA_FRAME_SCHEMA into a DataFrame and
+            performing validation and processing steps.
 
-        _validate_required_columns():
-            Checks if all required columns are present in the input DataFrame. Raises a
+        _validate_required_columns(columns):
+            Checks if all required columns are present in the input CSV header. Raises a
             ValueError if any required columns are missing.
 
         _validate_schema():
             Validates the schema of the input DataFrame, including data types, nullability,
-            and allowed values for specific columns. Raises a ValueError if any validation
-            errors are found.
-
-        _validate_categories():
-            Ensures the 'red_list_category' column contains valid categories as defined by
-            RED_LIST_CATEGORY_WEIGHTS. Raises a ValueError if invalid categories are found
-            or if the column is empty.
+            and allowed values for specific columns, in a single pass over the columns. The
+            'red_list_category' values are checked against RED_LIST_CATEGORY_WEIGHTS this way.
+            Raises a ValueError if any validation errors are found or if the input has no rows.
 
         _add_weights_column():
-            Adds a 'weights' column to the DataFrame by mapping the 'red_list_category'
-            values to their corresponding weights defined in RED_LIST_CATEGORY_WEIGHTS.
+            Adds an Int8 'weights' column to the DataFrame by encoding the 'red_list_category'
+            values as integer codes and looking up their corresponding weights defined in
+            RED_LIST_CATEGORY_WEIGHTS.
     """
 
     INPUT_DATA_FRAME_SCHEMA = {
@@ -49,14 +57,15 @@ class DataFrameProcessor:
     }
 
     def __init__(self, input_file):
-        self.df = pl.read_csv(input_file)
-        self._validate_required_columns()
+        lf = pl.scan_csv(input_file)
+        self._validate_required_columns(lf.collect_schema().names())
+        # Only the columns we validate and use are read from the file.
+        self.df = lf.select(list(self.INPUT_DATA_FRAME_SCHEMA)).collect()
         self._validate_schema()
-        self._validate_categories()
         self._add_weights_column()
 
-    def _validate_required_columns(self):
-        missing = set(self.INPUT_DATA_FRAME_SCHEMA) - set(self.df.columns)
+    def _validate_required_columns(self, columns):
+        missing = set(self.INPUT_DATA_FRAME_SCHEMA) - set(columns)
         if missing:
             raise ValueError(
                 f"Missing required column(s): {', '.join(sorted(missing))}"
@@ -64,6 +73,7 @@ class DataFrameProcessor:
 
     def _validate_schema(self):
         schema = self.df.schema
+        null_counts = self.df.null_count().row(0, named=True)
         errors = []
 
         for col, spec in self.INPUT_DATA_FRAME_SCHEMA.items():
@@ -74,16 +84,21 @@ class DataFrameProcessor:
                 )
 
             if spec.get("not_null", False):
-                nulls = self.df[col].null_count()
+                nulls = null_counts[col]
                 if nulls > 0:
                     errors.append(f"Column '{col}' contains {nulls} null value(s)")
 
             if "allowed" in spec:
-                bad = self.df.select(pl.col(col)).filter(
-                    ~pl.col(col).is_in(spec["allowed"])
-                )
-                if bad.height > 0:
-                    bad_vals = bad.unique().to_series().to_list()
+                # Casting to an Enum of the allowed values turns every disallowed value
+                # into a null, so the valid case is decided by comparing null counts.
+                values = self.df[col]
+                encoded = values.cast(pl.Enum(list(spec["allowed"])), strict=False)
+                if encoded.null_count() > values.null_count():
+                    bad_vals = (
+                        values.filter(encoded.is_null() & values.is_not_null())
+                        .unique()
+                        .to_list()
+                    )
                     errors.append(
                         f"Column '{col}' has invalid value(s) {bad_vals}; "
                         f"allowed: {spec['allowed']}"
@@ -92,23 +107,16 @@ class DataFrameProcessor:
         if errors:
             raise ValueError("Validation errors:\n" + "\n".join(errors))
 
-    def _validate_categories(self):
-        found_categories = set(self.df["red_list_category"].unique().to_list())
-        if not found_categories:
+        # Invalid and null categories are reported above through the "allowed" and
+        # "not_null" checks, so only an input without any rows is left to reject.
+        if self.df["red_list_category"].is_empty():
             raise ValueError("Input DataFrame has an empty 'red_list_category' column")
 
-        valid_categories = set(RED_LIST_CATEGORY_WEIGHTS.keys())
-        invalid_categories = found_categories - valid_categories
-
-        if invalid_categories:
-            raise ValueError(
-                f"Invalid value found in 'red_list_category' column: {sorted(invalid_categories)}"
-            )
-
     def _add_weights_column(self):
         self.df = self.df.with_columns(
-            pl.col("red_list_category")
-            .replace(RED_LIST_CATEGORY_WEIGHTS)
-            .cast(pl.Int64)
+            pl.lit(_CATEGORY_WEIGHT_LOOKUP)
+            .gather(
+                pl.col("red_list_category").cast(_RED_LIST_CATEGORY_ENUM).to_physical()
+            )
             .alias("weights")
         )
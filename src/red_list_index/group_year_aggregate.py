@@ -7,8 +7,8 @@ class GroupYearAggregate:
         Aggregates Red List Index (RLI) data for each group across the full range of years.
 
         This function takes a DataFrame containing extrapolated Red List Index (RLI) data,
-        sorts it by the "year" column, groups the data by "year", and computes aggregate
-        statistics for each year. The resulting DataFrame includes the following columns:
+        groups the data by "year", computes aggregate statistics for each year and returns
+        them sorted by year. The resulting DataFrame includes the following columns:
         - "group": A constant value "Aggregate" for all rows.
         - "rli": The mean value of the "rli" column for each year.
         - "qn_95": A placeholder column with None values.
@@ -19,18 +19,20 @@ class GroupYearAggregate:
         the dataframe containing comprehensive group RLI's.
 
         Args:
-            df_rli_extrapolated_data (polars.DataFrame): A DataFrame containing extrapolated
-                RLI data with at least a "year" column and an "rli" column.
+            df_rli_extrapolated_data (polars.DataFrame or polars.LazyFrame): A DataFrame containing
+                extrapolated RLI data with at least a "year" column and an "rli" column. Passing a
+                LazyFrame keeps the aggregation in the caller's lazy query plan.
 
         Returns:
-            polars.DataFrame: A DataFrame with aggregated data grouped by year.
+            polars.DataFrame or polars.LazyFrame: A frame of the same kind as the input with
+            aggregated data grouped by year.
         """
 
         # Note: Polars .mean() method calculates and returns the arithmetic mean of elements
         #       as specified in Butchart et al., 2010.
+        # group_by hashes the years, so only the small aggregated output is sorted.
         return (
-            df_rli_extrapolated_data.sort("year")
-            .group_by("year")
+            df_rli_extrapolated_data.group_by("year")
             .agg(
                 [
                     pl.lit("Aggregate").alias("taxonomic_group"),
@@ -45,4 +47,5 @@ class GroupYearAggregate:
                     .alias("taxonomic_group_sample_sizes"),
                 ]
             )
+            .sort("year")
         )
@@ -1,87 +1,96 @@
-import numpy as np
 import polars as pl
 
+# Columns extrapolated with a linear trend per group.
+_TREND_COLUMNS = ("rli", "qn_05", "qn_95")
+
 
 class GroupYearExtrapolation:
     def extrapolate_trends_for(trends_df):
         """
         Extrapolates trends for each group in the given DataFrame by fitting a linear model
-        and extending the trend across the full range of years.
+        and extending the trend across the full range of years. The least-squares slope and
+        intercept of every group and trend column are computed in closed form by a single
+        group_by aggregation, and the fitted lines are evaluated for all years in one pass.
 
         Parameters:
-            trends_df (pl.DataFrame): A Polars DataFrame containing columns:
+            trends_df (pl.DataFrame or pl.LazyFrame): A Polars frame containing columns:
                 - "year" (int): The year of the trend data.
                 - "rli" (float): The Red List Index value for the corresponding year.
                 - "taxonomic_group" (str): The group identifier.
 
         Returns:
-            pl.DataFrame: A Polars DataFrame containing extrapolated trends for all groups
-            across the full range of years. The resulting DataFrame includes columns:
+            pl.DataFrame or pl.LazyFrame: A frame of the same kind as the input containing
+            extrapolated trends for all groups across the full range of years. Passing a
+            LazyFrame keeps the extrapolation in the caller's lazy query plan. The resulting DataFrame includes columns:
                 - "year" (int): The year of the extrapolated trend data.
                 - "rli" (float): The extrapolated Red List Index value, clipped between 0.0 and 1.0.
                 - "group" (str): The group identifier.
         """
-        df_full_extrapolated = pl.DataFrame(
-            {
-                "year": pl.Series([], dtype=pl.Int64),
-                "rli": pl.Series([], dtype=pl.Float64),
-                "qn_05": pl.Series([], dtype=pl.Float64),
-                "qn_95": pl.Series([], dtype=pl.Float64),
-                "n": pl.Series([], dtype=pl.Float64),
-                "taxonomic_group_sample_sizes": pl.Series([], dtype=pl.Utf8),
-            }
-        )
-
-        groups = (
-            trends_df.select("taxonomic_group").unique()["taxonomic_group"].to_list()
-        )
-
-        # Get full year range across all groups
-        all_years = trends_df.select(["year"]).unique().sort("year")
-
-        for group in groups:
-            group_df = trends_df.filter(pl.col("taxonomic_group") == group).select(
-                ["year", "rli", "qn_05", "qn_95", "n", "taxonomic_group_sample_sizes"]
-            )
-
-            rli_slope, rli_intercept = np.polyfit(
-                group_df["year"].to_numpy(), group_df["rli"].to_numpy(), deg=1
-            )
-
-            qn_05_slope, qn_05_intercept = np.polyfit(
-                group_df["year"].to_numpy(), group_df["qn_05"].to_numpy(), deg=1
-            )
+        year = pl.col("year").cast(pl.Float64)
+        year_offset = year - year.mean()
 
-            qn_95_slope, qn_95_intercept = np.polyfit(
-                group_df["year"].to_numpy(), group_df["qn_95"].to_numpy(), deg=1
+        # slope = sum((x - mean(x)) * (y - mean(y))) / sum((x - mean(x))^2). Centring on
+        # the mean year avoids the cancellation of the raw sum-of-squares formula. A group
+        # observed in a single year has 0 / 0 as its slope and gets a flat trend.
+        year_variance = (year_offset**2).sum()
+        slopes = [
+            (
+                (year_offset * (pl.col(column) - pl.col(column).mean())).sum()
+                / year_variance
             )
+            .fill_nan(0.0)
+            .alias(f"{column}_slope")
+            for column in _TREND_COLUMNS
+        ]
 
-            n = group_df["n"].mean()  # if group_df["n"].not_null().any() else 0.0
-            taxonomic_group_sample_sizes = (
-                group_df["taxonomic_group_sample_sizes"]
+        coefficients = (
+            trends_df.lazy()
+            .group_by("taxonomic_group", maintain_order=True)
+            .agg(
+                year.mean().alias("mean_year"),
+                *[
+                    pl.col(column).mean().alias(f"{column}_mean")
+                    for column in _TREND_COLUMNS
+                ],
+                *slopes,
+                pl.col("n").mean().cast(pl.Float64).alias("n"),
+                pl.col("taxonomic_group_sample_sizes")
                 .unique()
-                .str.concat(";")
-                .to_list()[0]
+                .str.join(";")
+                .alias("taxonomic_group_sample_sizes"),
             )
+        )
 
-            full_group_df = all_years.with_columns(
-                [
-                    (pl.col("year") * rli_slope + rli_intercept)
-                    .clip(lower_bound=0.0, upper_bound=1.0)
-                    .alias("rli"),
-                    (pl.col("year") * qn_05_slope + qn_05_intercept)
-                    .clip(lower_bound=0.0, upper_bound=1.0)
-                    .alias("qn_05"),
-                    (pl.col("year") * qn_95_slope + qn_95_intercept)
-                    .clip(lower_bound=0.0, upper_bound=1.0)
-                    .alias("qn_95"),
-                    pl.lit(n).alias("n"),
-                    pl.lit(taxonomic_group_sample_sizes).alias(
-                        "taxonomic_group_sample_sizes"
-                    ),
-                ]
-            )
+        # Get full year range across all groups. Only the first and last year are
+        # needed, so the range is generated rather than sorting the unique years, and
+        # it has no gaps even when no group covers some of the years in between.
+        all_years = trends_df.lazy().select(
+            pl.int_range(
+                # An empty input has no min/max year; fall back to an empty range.
+                pl.col("year").min().fill_null(0),
+                (pl.col("year").max() + 1).fill_null(0),
+                dtype=trends_df.collect_schema()["year"],
+            ).alias("year")
+        )
 
-            df_full_extrapolated = df_full_extrapolated.vstack(full_group_df)
+        # Years are cast to Float64 once and shared by the three trend lines, so each
+        # line is a single Float64 multiply-add rather than an Int64 -> Float64 cast per
+        # column.
+        years_from_mean = pl.col("year").cast(pl.Float64) - pl.col("mean_year")
+        extrapolated = coefficients.join(all_years, how="cross").select(
+            "year",
+            *[
+                (pl.col(f"{column}_mean") + pl.col(f"{column}_slope") * years_from_mean)
+                .clip(lower_bound=0.0, upper_bound=1.0)
+                .alias(column)
+                for column in _TREND_COLUMNS
+            ],
+            "n",
+            "taxonomic_group_sample_sizes",
+        )
 
-        return df_full_extrapolated
+        return (
+            extrapolated
+            if isinstance(trends_df, pl.LazyFrame)
+            else extrapolated.collect()
+        )
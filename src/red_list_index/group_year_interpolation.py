@@ -1,5 +1,11 @@
 import polars as pl
 
+# Columns linearly interpolated between observed years.
+_INTERPOLATED_COLUMNS = ("rli", "qn_05", "qn_95")
+
+# Columns carried forward from the latest observed year.
+_FORWARD_FILLED_COLUMNS = ("n", "taxonomic_group_sample_sizes")
+
 
 class GroupYearInterpolation:
     """
@@ -7,10 +13,11 @@ class GroupYearInterpolation:
 
     For each unique group in the input DataFrame, this function:
       - Determines the full range of years from the group's minimum to maximum year.
-      - Joins the group's data to this full year range, introducing NaNs where data is missing.
-      - Linearly interpolates missing values for 'rli', 'qn_05', and 'qn_95' columns.
-      - Fills and interpolates the 'n' and 'group_sample_sizes' columns as appropriate.
-      - Concatenates the interpolated results for all groups into a single DataFrame.
+      - Linearly interpolates 'rli', 'qn_05', and 'qn_95' across that range.
+      - Forward fills the 'n' and 'group_sample_sizes' columns from the latest observed year.
+
+    All groups are handled by a single lazy query: the ranges are built with pl.int_range,
+    joined with the observed rows, and filled with interpolate/forward_fill over each group.
 
     Args:
         rli_df (pl.DataFrame): Input Polars DataFrame containing at least 'group', 'year', 'rli', 'qn_05', 'qn_95', 'n', and 'group_sample_sizes' columns.
@@ -20,38 +27,40 @@ class GroupYearInterpolation:
     """
 
     def interpolate_rli_for_missing_years(rli_df):
-        unique_groups_list = rli_df["taxonomic_group"].unique()
-        df_list = []
-        for group in unique_groups_list:
-            group_rli_df = rli_df.filter(pl.col("taxonomic_group") == group)
-
-            all_years = pl.DataFrame(
-                {
-                    "year": list(
-                        range(
-                            group_rli_df["year"].min(), group_rli_df["year"].max() + 1
-                        )
-                    )
-                }
+        # The full range of years for every group is built in one aggregation, and the
+        # observed rows are joined onto it so the gaps can be filled with window
+        # expressions instead of a Python loop over the groups.
+        all_group_years = (
+            rli_df.lazy()
+            .group_by("taxonomic_group", maintain_order=True)
+            .agg(
+                pl.int_range(
+                    pl.col("year").min(),
+                    pl.col("year").max() + 1,
+                    dtype=rli_df.schema["year"],
+                ).alias("year")
+            )
+            .explode("year")
+        )
+        return (
+            all_group_years.join(
+                rli_df.lazy(),
+                on=["taxonomic_group", "year"],
+                how="left",
+                maintain_order="left",
             )
-            df_full = all_years.join(group_rli_df, on="year", how="left")
-            # Fill group and interpolate rli
-            df_full = df_full.with_columns(
-                [
-                    pl.lit(group).alias("taxonomic_group"),
-                    pl.col("rli").interpolate(),
-                    pl.col("qn_05").interpolate(),
-                    pl.col("qn_95").interpolate(),
-                    pl.col("n")
-                    .fill_null(strategy="forward")
-                    .interpolate()
-                    .cast(pl.Int64)
-                    .alias("n"),
-                    pl.col("taxonomic_group_sample_sizes")
-                    .fill_null(strategy="forward")
-                    .interpolate()
-                    .alias("taxonomic_group_sample_sizes"),
-                ]
+            .with_columns(
+                *[
+                    pl.col(column).interpolate().over("taxonomic_group")
+                    for column in _INTERPOLATED_COLUMNS
+                ],
+                *[
+                    pl.col(column).forward_fill().over("taxonomic_group")
+                    for column in _FORWARD_FILLED_COLUMNS
+                ],
             )
-            df_list.append(df_full)
-        return pl.concat(df_list)
+            .with_columns(pl.col("n").cast(pl.Int64))
+            # Keep the column order of the input, with year first.
+            .select(["year", *[c for c in rli_df.columns if c != "year"]])
+            .collect()
+        )
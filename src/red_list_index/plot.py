@@ -14,19 +14,22 @@ class Plot:
         self.df = df
 
     def global_rli(self, filename="rli.png"):
-        # Convert to pandas for Seaborn/Matplotlib
-        rli_df = self.df.to_pandas()
-
         # Set Seaborn style
         sns.set(style="whitegrid")
         plt.figure(figsize=(8, 5))
 
-        # Plot each group
-        groups = rli_df["taxonomic_group"].unique()
-        for group in groups:
-            sub = rli_df[rli_df["taxonomic_group"] == group]
-            plt.plot(sub["year"], sub["rli"], label=group, lw=0.5)  # No marker
-            plt.fill_between(sub["year"], sub["qn_05"], sub["qn_95"], alpha=0.2)
+        # Plot each group, split in one pass and passed to Matplotlib as NumPy
+        # arrays rather than converting the whole frame to pandas and masking it
+        # once per group.
+        groups = self.df.partition_by(
+            "taxonomic_group", as_dict=True, maintain_order=True
+        )
+        for (group,), sub in groups.items():
+            year = sub["year"].to_numpy()
+            plt.plot(year, sub["rli"].to_numpy(), label=group, lw=0.5)  # No marker
+            plt.fill_between(
+                year, sub["qn_05"].to_numpy(), sub["qn_95"].to_numpy(), alpha=0.2
+            )
         plt.xlabel("Year")
         plt.ylabel("RLI")
         plt.title("RLI by Taxonomic Group Over Time")
@@ -1,6 +1,7 @@
-from red_list_index.calculate import Calculate
+from red_list_index.calculate import Calculate, red_list_index_from_counts
 from red_list_index.constants import RED_LIST_CATEGORY_WEIGHTS
 
+import numpy as np
 import polars as pl
 
 
@@ -13,6 +14,12 @@ def test_calculate_red_list_index_basic():
     assert result == 0.4
 
 
+def test_calculate_red_list_index_numpy_array():
+    calc = Calculate(np.array([1, 2, 3, 4, 5], dtype=np.int8))
+    result = calc.red_list_index()
+    assert result == 0.4
+
+
 def test_calculate_red_list_index_birds_2024():
     weighted_df = get_weighted_red_list(taxonomic_group="Bird", year=2024)
 
@@ -54,6 +61,14 @@ def test_init_validation_with_value_greater_than_ex():
         assert "Value greater than EX found at index 2" in str(e)
 
 
+def test_red_list_index_from_counts_rejects_wrong_number_of_counts():
+    try:
+        red_list_index_from_counts(np.array([0, 1, 1, 1, 1, 1, 1]), 5)
+        assert False, "Should raise a ValueError for more than EX + 1 weight counts"
+    except ValueError as e:
+        assert str(e) == "Expected 6 weight counts (0 to EX), got 7."
+
+
 def test_init_validation_with_empty_weights():
     try:
         Calculate([])
@@ -92,3 +107,13 @@ def get_weighted_red_list(
     )
     weighted = add_weight_column(filtered)
     return weighted.drop_nulls(subset=["weights"])
+
+
+def test_init_validation_with_negative_value_in_numpy_array():
+    try:
+        Calculate(np.array([1, 2, -3]))
+        assert False, (
+            "Should raise a ValueError for a negative value in category_weights"
+        )
+    except ValueError as e:
+        assert str(e) == "Negative value found at index 2: -3"
@@ -1,3 +1,4 @@
+import numpy as np
 import polars as pl
 import pytest
 import random
@@ -75,7 +76,52 @@ def test_calculate_groups_initialization_with_10_repetitions():
     )
 
 
-def test_replace_data_deficient_rows():
+def test_calculate_groups_with_seed_is_reproducible():
+    data = {
+        "sis_taxon_id": [1, 2, 3, 4, 5, 6],
+        "red_list_category": ["LC", "EN", "DD", "VU", "CR", "DD"],
+        "year": [2020, 2020, 2020, 2021, 2021, 2021],
+        "taxonomic_group": ["Mammals", "Mammals", "Mammals", "Birds", "Birds", "Birds"],
+        "weights": [0, 3, None, 2, 4, None],
+    }
+    df = pl.DataFrame(data)
+
+    first = CalculateGroups(df, number_of_repetitions=20, seed=42).df
+    second = CalculateGroups(df, number_of_repetitions=20, seed=42).df
+
+    assert (
+        first.sort("taxonomic_group").to_dicts()
+        == second.sort("taxonomic_group").to_dicts()
+    )
+
+
+def test_calculate_groups_rejects_weight_greater_than_ex():
+    df = create_sample_dataframe().with_columns(weights=pl.Series([6, 6, 4, 5]))
+
+    with pytest.raises(
+        ValueError, match="Value greater than EX found at index 0: 6 > 5"
+    ):
+        CalculateGroups(df)
+
+
+def test_calculate_groups_rejects_weight_overflowing_int8():
+    # 300 would wrap to 44 in the int8 cast if it were not rejected first
+    df = create_sample_dataframe().with_columns(weights=pl.Series([300, 0, 4, 5]))
+
+    with pytest.raises(
+        ValueError, match="Value greater than EX found at index 0: 300 > 5"
+    ):
+        CalculateGroups(df)
+
+
+def test_calculate_groups_rejects_non_integer_weight():
+    df = create_sample_dataframe().with_columns(weights=pl.Series([4.0, 5.0, 1.5, 2.0]))
+
+    with pytest.raises(ValueError, match="Non-integer value found at index 0: 1.5"):
+        CalculateGroups(df)
+
+
+def test_sample_random_weight_counts():
     # Create a sample DataFrame with some Data Deficient rows
     data = {
         "sis_taxon_id": [1, 2, 3, 4],
@@ -89,28 +135,48 @@ def test_replace_data_deficient_rows():
     # Initialize CalculateGroups
     calculate_groups = CalculateGroups(df, number_of_repetitions=1)
 
-    # Call _replace_data_deficient_rows
-    replaced_weights = calculate_groups._replace_data_deficient_rows(df)
+    valid_weights = calculate_groups._get_valid_weights(df)
+    data_deficient_count = calculate_groups._get_data_deficient_count(df)
+    assert valid_weights.tolist() == [2, 5]
+    assert data_deficient_count == 2
 
-    # Assert that the replaced weights contain no None values
-    assert all(weight is not None for weight in replaced_weights), (
-        "Weights contain None values"
+    # Weights are drawn with replacement, so only the valid weights can be drawn
+    valid_weight_counts = np.bincount(valid_weights, minlength=6)
+    random_weight_counts = calculate_groups._sample_random_weight_counts(
+        valid_weight_counts, data_deficient_count, 10
+    )
+    assert random_weight_counts.shape == (10, 6)
+    assert (random_weight_counts.sum(axis=1) == 2).all()
+    assert (random_weight_counts[:, [0, 1, 3, 4]] == 0).all(), (
+        "Sampled weight counts mismatch"
     )
 
-    # Assert that the replaced weights include valid weights and random samples
-    valid_weights = df.filter(pl.col("weights").is_not_null())["weights"].to_numpy()
-    assert all(
-        weight in valid_weights for weight in replaced_weights[: len(valid_weights)]
-    ), "Valid weights are missing"
-
-    # Assert that the length of replaced weights matches the original DataFrame's weights
-    assert len(replaced_weights) == len(df["weights"]), (
-        "Replaced weights length mismatch"
+    # More DD species than valid weights can be sampled
+    random_weight_counts = calculate_groups._sample_random_weight_counts(
+        valid_weight_counts, 3
     )
+    assert random_weight_counts.sum() == 3
 
     # Assert that ValueError is raised when no valid weights are present
     empty_df = pl.DataFrame({"weights": [None, None]})
     with pytest.raises(
         ValueError, match="No valid weights found in the DataFrame to sample from."
     ):
-        calculate_groups._replace_data_deficient_rows(empty_df)
+        calculate_groups._calculate_rli_for(empty_df)
+
+
+def test_sample_random_weight_counts_for_multiple_repetitions():
+    # One species at each of weights 0, 1 and 2
+    valid_weight_counts = np.array([1, 1, 1, 0, 0, 0])
+    calculate_groups = CalculateGroups(create_sample_dataframe(), seed=1)
+
+    random_weight_counts = calculate_groups._sample_random_weight_counts(
+        valid_weight_counts, 2, 200
+    )
+
+    assert random_weight_counts.shape == (200, 6)
+    # Two weights drawn with replacement from [0, 1, 2]
+    assert (random_weight_counts.sum(axis=1) == 2).all()
+    assert (random_weight_counts[:, 3:] == 0).all()
+    # With replacement the same weight is sometimes drawn twice
+    assert (random_weight_counts == 2).any()
@@ -1,4 +1,5 @@
 import csv
+import polars as pl
 import pytest
 from red_list_index.data_frame_processor import DataFrameProcessor
 from tempfile import NamedTemporaryFile
@@ -34,6 +35,44 @@ def test_valid_data_frame():
         RED_LIST_CATEGORY_WEIGHTS[cat] for cat in data["red_list_category"]
     ]
     assert processor.df["weights"].to_list() == expected_weights
+    assert processor.df.schema["weights"] == pl.Int8
+
+
+def test_unused_columns_are_not_loaded():
+    """Test that columns outside the input schema are dropped at read time."""
+    data = {
+        "sis_taxon_id": [1, 2, 3],
+        "scientific_name": ["A a", "B b", "C c"],
+        "red_list_category": ["LC", "VU", "EN"],
+        "year": [2020, 2021, 2022],
+        "taxonomic_group": ["Mammals", "Birds", "Reptiles"],
+    }
+    input_file = create_test_csv(data)
+    processor = DataFrameProcessor(input_file)
+
+    assert processor.df.columns == [
+        "sis_taxon_id",
+        "red_list_category",
+        "year",
+        "taxonomic_group",
+        "weights",
+    ]
+
+
+def test_data_deficient_weights_are_null():
+    """Test that every category maps to its weight and DD maps to null."""
+    categories = list(RED_LIST_CATEGORY_WEIGHTS)
+    data = {
+        "sis_taxon_id": list(range(len(categories))),
+        "red_list_category": categories,
+        "year": [2020] * len(categories),
+        "taxonomic_group": ["Mammals"] * len(categories),
+    }
+    input_file = create_test_csv(data)
+    processor = DataFrameProcessor(input_file)
+
+    assert processor.df["weights"].to_list() == list(RED_LIST_CATEGORY_WEIGHTS.values())
+    assert processor.df["weights"].null_count() == 1
 
 
 def test_missing_required_columns():
@@ -49,3 +49,24 @@ def test_calculate_aggregate_from_valid_input():
         result["taxonomic_group_sample_sizes"].to_list()
         == expected["taxonomic_group_sample_sizes"].to_list()
     )
+    assert result.schema["taxonomic_group_sample_sizes"] == pl.Utf8
+
+
+def test_calculate_aggregate_from_lazy_input():
+    df_rli_extrapolated_data = pl.DataFrame(
+        {
+            "year": [2001, 2000, 2000],
+            "rli": [0.7, 0.5, 0.6],
+            "qn_05": [0.7, 0.5, 0.6],
+            "qn_95": [0.7, 0.5, 0.6],
+            "n": [1, 1, 1],
+            "taxonomic_group_sample_sizes": ["Bird (1)", "Bird (1)", "Mammal (1)"],
+        }
+    )
+    result = GroupYearAggregate.calculate_aggregate_from(
+        df_rli_extrapolated_data.lazy()
+    )
+    assert isinstance(result, pl.LazyFrame)
+
+    expected = GroupYearAggregate.calculate_aggregate_from(df_rli_extrapolated_data)
+    assert result.collect().sort("year").to_dicts() == expected.sort("year").to_dicts()
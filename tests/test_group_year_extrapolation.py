@@ -0,0 +1,146 @@
+import polars as pl
+import pytest
+
+from red_list_index.group_year_extrapolation import GroupYearExtrapolation
+
+
+def test_extrapolate_trends_for_valid_input():
+    trends_df = pl.DataFrame(
+        {
+            "year": [2000, 2001, 2002, 2001, 2002],
+            "taxonomic_group": ["Bird", "Bird", "Bird", "Mammal", "Mammal"],
+            "rli": [0.5, 0.6, 0.7, 0.8, 0.7],
+            "qn_05": [0.4, 0.5, 0.6, 0.7, 0.6],
+            "qn_95": [0.6, 0.7, 0.8, 0.95, 0.9],
+            "n": [10, 10, 10, 10, 10],
+            "taxonomic_group_sample_sizes": [
+                "Bird (3)",
+                "Bird (3)",
+                "Bird (3)",
+                "Mammal (2)",
+                "Mammal (2)",
+            ],
+        }
+    )
+
+    result = GroupYearExtrapolation.extrapolate_trends_for(trends_df).sort(
+        ["taxonomic_group_sample_sizes", "year"]
+    )
+
+    assert result.columns == [
+        "year",
+        "rli",
+        "qn_05",
+        "qn_95",
+        "n",
+        "taxonomic_group_sample_sizes",
+    ]
+    assert result["year"].to_list() == [2000, 2001, 2002, 2000, 2001, 2002]
+    assert result["rli"].to_list() == pytest.approx([0.5, 0.6, 0.7, 0.9, 0.8, 0.7])
+    assert result["qn_05"].to_list() == pytest.approx([0.4, 0.5, 0.6, 0.8, 0.7, 0.6])
+    # Extrapolated values are clipped to the [0, 1] range
+    assert result["qn_95"].to_list() == pytest.approx([0.6, 0.7, 0.8, 1.0, 0.95, 0.9])
+    assert result["n"].to_list() == [10.0] * 6
+    assert result["taxonomic_group_sample_sizes"].to_list() == [
+        "Bird (3)",
+        "Bird (3)",
+        "Bird (3)",
+        "Mammal (2)",
+        "Mammal (2)",
+        "Mammal (2)",
+    ]
+
+
+def test_extrapolate_trends_for_group_with_a_single_year():
+    trends_df = pl.DataFrame(
+        {
+            "year": [2000, 2001, 2001],
+            "taxonomic_group": ["Bird", "Bird", "Mammal"],
+            "rli": [0.5, 0.6, 0.8],
+            "qn_05": [0.4, 0.5, 0.7],
+            "qn_95": [0.6, 0.7, 0.9],
+            "n": [10, 10, 10],
+            "taxonomic_group_sample_sizes": ["Bird (3)", "Bird (3)", "Mammal (2)"],
+        }
+    )
+
+    result = GroupYearExtrapolation.extrapolate_trends_for(trends_df).filter(
+        pl.col("taxonomic_group_sample_sizes") == "Mammal (2)"
+    )
+
+    # A single observation has no trend, so its values are carried to every year
+    assert result.sort("year")["year"].to_list() == [2000, 2001]
+    assert result["rli"].to_list() == pytest.approx([0.8, 0.8])
+    assert result["qn_05"].to_list() == pytest.approx([0.7, 0.7])
+    assert result["qn_95"].to_list() == pytest.approx([0.9, 0.9])
+
+
+def test_extrapolate_trends_for_lazy_input():
+    trends_df = pl.DataFrame(
+        {
+            "year": [2000, 2001, 2002],
+            "taxonomic_group": ["Bird", "Bird", "Bird"],
+            "rli": [0.5, 0.6, 0.7],
+            "qn_05": [0.4, 0.5, 0.6],
+            "qn_95": [0.6, 0.7, 0.8],
+            "n": [10, 10, 10],
+            "taxonomic_group_sample_sizes": ["Bird (3)", "Bird (3)", "Bird (3)"],
+        }
+    )
+    result = GroupYearExtrapolation.extrapolate_trends_for(trends_df.lazy())
+    assert isinstance(result, pl.LazyFrame)
+
+    expected = GroupYearExtrapolation.extrapolate_trends_for(trends_df)
+    assert result.collect().sort("year").to_dicts() == expected.sort("year").to_dicts()
+
+
+def test_extrapolate_trends_for_covers_years_missing_from_every_group():
+    trends_df = pl.DataFrame(
+        {
+            "year": [2000, 2001, 2003, 2004],
+            "taxonomic_group": ["Bird", "Bird", "Mammal", "Mammal"],
+            "rli": [0.5, 0.6, 0.8, 0.7],
+            "qn_05": [0.4, 0.5, 0.7, 0.6],
+            "qn_95": [0.6, 0.7, 0.9, 0.8],
+            "n": [10, 10, 10, 10],
+            "taxonomic_group_sample_sizes": [
+                "Bird (2)",
+                "Bird (2)",
+                "Mammal (2)",
+                "Mammal (2)",
+            ],
+        }
+    )
+
+    result = GroupYearExtrapolation.extrapolate_trends_for(trends_df)
+
+    # 2002 is not observed for any group but lies within the overall range
+    for group in ["Bird (2)", "Mammal (2)"]:
+        years = result.filter(pl.col("taxonomic_group_sample_sizes") == group)["year"]
+        assert years.sort().to_list() == [2000, 2001, 2002, 2003, 2004]
+
+
+def test_extrapolate_trends_for_empty_input():
+    trends_df = pl.DataFrame(
+        schema={
+            "year": pl.Int64,
+            "taxonomic_group": pl.Utf8,
+            "rli": pl.Float64,
+            "qn_05": pl.Float64,
+            "qn_95": pl.Float64,
+            "n": pl.Int64,
+            "taxonomic_group_sample_sizes": pl.Utf8,
+        }
+    )
+
+    result = GroupYearExtrapolation.extrapolate_trends_for(trends_df)
+
+    assert result.height == 0
+    assert result.columns == [
+        "year",
+        "rli",
+        "qn_05",
+        "qn_95",
+        "n",
+        "taxonomic_group_sample_sizes",
+    ]
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+import red_list_index
+from red_list_index.calculate import Calculate
+
+
+def test_package_exports_are_resolved_lazily():
+    assert red_list_index.Calculate is Calculate
+    assert set(red_list_index.__all__) <= set(dir(red_list_index))
+    # A resolved export is cached in the module globals but listed only once
+    names = dir(red_list_index)
+    assert len(names) == len(set(names))
+
+
+def test_package_import_does_not_import_plot():
+    code = (
+        "import sys, red_list_index; "
+        "red_list_index.Calculate; "
+        "assert 'red_list_index.plot' not in sys.modules; "
+        "assert 'matplotlib' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)